@@ -13,7 +13,6 @@
 # limitations under the License.
 import json
 from collections.abc import Sequence
-from copy import deepcopy
 from typing import Any, Optional, Union, cast
 
 from pytket.backends import Backend, CircuitStatus, ResultHandle, StatusEnum
@@ -47,6 +46,7 @@ from pytket.unit_id import UnitID
 from ..backends.config import AQTConfig
 from ..extension_version import __extension_version__
 from ..multi_zone_architecture.architecture import MultiZoneArchitecture
+from ..multi_zone_architecture.circuit.helpers import custom_gate_name
 from ..multi_zone_architecture.circuit.multizone_circuit import (
     MultiZoneCircuit,
 )
@@ -342,10 +342,9 @@ class AQTMultiZoneBackend(Backend):
         """
 
         circuit.validate()
-        new_initial_zone_to_qubits = deepcopy(circuit.initial_zone_to_qubits)
         new_circuit = MultiZoneCircuit(
             circuit.architecture,
-            new_initial_zone_to_qubits,
+            circuit.initial_zone_to_qubits,
             circuit.pytket_circuit.n_qubits,
             circuit.pytket_circuit.n_bits,
         )
@@ -353,25 +352,18 @@ class AQTMultiZoneBackend(Backend):
             circuit.pytket_circuit, optimisation_level
         )
 
-        new_circuit.zone_to_qubits = deepcopy(circuit.zone_to_qubits)
-        new_circuit.multi_zone_operations = deepcopy(circuit.multi_zone_operations)
+        new_circuit.copy_move_state_from(circuit)
 
-        current_multiop_index_per_qubit: dict[int, int] = {
-            k: 0 for k in new_circuit.multi_zone_operations
-        }
+        current_move_index_per_qubit = [0] * circuit.architecture.n_qubits_max
         for cmd in compiled_circuit:
             op = cmd.op
             if op.type == OpType.Barrier:
                 if len(cmd.args) == len(circuit.all_qubit_list):
                     continue
                 qubit = cmd.args[0].index[0]
-                current_multiop_index = current_multiop_index_per_qubit[qubit]
-                mult_op_bundles = new_circuit.multi_zone_operations[qubit]
-                multi_ops = mult_op_bundles[current_multiop_index]
-                for multi_op in multi_ops:
-                    multi_op.append_to_circuit(new_circuit)
-                new_circuit.add_move_barrier()
-                current_multiop_index_per_qubit[qubit] = current_multiop_index + 1
+                current_move_index = current_move_index_per_qubit[qubit]
+                new_circuit.add_recorded_move(qubit, current_move_index)
+                current_move_index_per_qubit[qubit] = current_move_index + 1
             else:
                 qubits = [q.index[0] for q in cmd.args]
                 new_circuit.add_gate(cmd.op.type, qubits, op.params)
@@ -393,9 +385,7 @@ def get_aqt_json_syntax_for_compiled_circuit(
         aqt_syntax_operation_list = _translate_aqt(circuit.pytket_circuit)[0]
     elif isinstance(circuit, Circuit):
         first_op = circuit.get_commands()[0].op
-        optype = first_op.type
-        op_string = f"{first_op}"
-        if optype != OpType.CustomGate or "INIT" not in op_string:
+        if custom_gate_name(first_op) != "INIT":
             raise Exception(
                 "Missing INIT in circuit, AQT json syntax can"
                 " only be generated from a compiled circuit"
@@ -421,9 +411,7 @@ def _get_initial_zone_to_qubit_data(
     zone_to_occupancy_offset: dict[int, tuple[int, int]] = {}
     for cmd in circ.get_commands():
         op = cmd.op
-        optype = op.type
-        op_string = f"{op}"
-        if optype == OpType.CustomGate and "INIT" in op_string:
+        if custom_gate_name(op) == "INIT":
             target_zone = int(op.params[0])
             qubits = [qubit.index[0] for qubit in cmd.args]
             zone_to_occupancy_offset[target_zone] = (len(qubits), 0)
@@ -460,7 +448,6 @@ def _translate_aqt(circ: Circuit) -> tuple[list[list], str]:
     for cmd in circ.get_commands():
         op = cmd.op
         optype = op.type
-        op_string = f"{op}"
         # https://www.aqt.eu/aqt-gate-definitions/
         if optype == OpType.Rx:
             gates.append(["X", op.params[0], [zop(q.index[0]) for q in cmd.args]])
@@ -471,17 +458,18 @@ def _translate_aqt(circ: Circuit) -> tuple[list[list], str]:
         elif optype == OpType.XXPhase:
             gates.append(["MS", op.params[0], [zop(q.index[0]) for q in cmd.args]])
         elif optype == OpType.CustomGate:
-            if "MOVE" in op_string:
+            gate_name = custom_gate_name(op)
+            if gate_name in ("MOVE", "MOVE_BARRIER"):
                 pass
-            elif "INIT" in op_string:
+            elif gate_name == "INIT":
                 target_zone = int(op.params[0])
                 gates.append(["INIT", [target_zone, len(cmd.args)]])
-            elif "PSWAP" in op_string:
+            elif gate_name == "PSWAP":
                 qubit_1 = cmd.args[0].index[0]
                 qubit_2 = cmd.args[1].index[0]
                 gates.append(["PSWAP", [zop(qubit_1), zop(qubit_2)]])
                 swap_position(qubit_1, qubit_2)
-            elif "SHUTTLE" in op_string:
+            elif gate_name == "SHUTTLE":
                 qubit = cmd.args[0].index[0]
                 (source_zone, source_position) = qubit_to_zone_position[qubit]
                 (source_occupancy, source_offset) = zone_to_occupancy_offset[
@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Union
 
 from pydantic import BaseModel, ConfigDict
 
 
-class EdgeType(str, Enum):
+class EdgeType(IntEnum):
     """Type of given zone edge
 
     Each zone has two edges that support connections,
@@ -30,10 +30,12 @@ class EdgeType(str, Enum):
     being a linear arrangement of ions on a horizontal line, with shuttling
     capabilities from the left or right side.
 
+    The values encode left and right edges as negative and positive
+    numbers, as used by the edge parameters of SHUTTLE gates.
     """
 
-    Right = "Right"
-    Left = "Left"
+    Right = 1
+    Left = -1
 
 
 class ConnectionType(str, Enum):
@@ -50,24 +52,22 @@ class ConnectionType(str, Enum):
     LeftToLeft = "LeftToLeft"
 
 
+_EDGE_TYPES: dict[ConnectionType, tuple[EdgeType, EdgeType]] = {
+    ConnectionType.RightToRight: (EdgeType.Right, EdgeType.Right),
+    ConnectionType.RightToLeft: (EdgeType.Right, EdgeType.Left),
+    ConnectionType.LeftToRight: (EdgeType.Left, EdgeType.Right),
+    ConnectionType.LeftToLeft: (EdgeType.Left, EdgeType.Left),
+}
+
+
 def source_edge_type(connection_type: ConnectionType) -> EdgeType:
     """Retrieves the "source" EdgeType from the ConnectionType"""
-    if (
-        connection_type == ConnectionType.RightToLeft
-        or connection_type == ConnectionType.RightToRight
-    ):
-        return EdgeType.Right
-    return EdgeType.Left
+    return _EDGE_TYPES[connection_type][0]
 
 
 def target_edge_type(connection_type: ConnectionType) -> EdgeType:
     """Retrieves the "target" EdgeType from the ConnectionType"""
-    if (
-        connection_type == ConnectionType.LeftToRight
-        or connection_type == ConnectionType.RightToRight
-    ):
-        return EdgeType.Right
-    return EdgeType.Left
+    return _EDGE_TYPES[connection_type][1]
 
 
 class ZoneConnection(BaseModel):
@@ -11,8 +11,22 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from pytket.circuit import CustomGate, Op
+
 ZonePlacement = dict[int, list[int]]
 
 
+def copy_zone_placement(placement: ZonePlacement) -> ZonePlacement:
+    """Copy a placement, the qubit list of each zone is copied"""
+    return {zone: qubits.copy() for zone, qubits in placement.items()}
+
+
 class ZoneRoutingError(Exception):
     pass
+
+
+def custom_gate_name(op: Op) -> str | None:
+    """Name of the custom gate definition of op, None if op is not a custom gate"""
+    if isinstance(op, CustomGate):
+        return op.gate.name
+    return None
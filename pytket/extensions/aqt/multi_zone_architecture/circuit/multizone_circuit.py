@@ -13,18 +13,24 @@
 # limitations under the License.
 
 import itertools
-from collections.abc import Iterator
-from copy import deepcopy
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from enum import Enum
+from functools import cache, lru_cache
 from typing import Any, Optional, TypeAlias
 
 from sympy import Expr, symbols  # type: ignore
 
-from pytket.circuit import Circuit, CustomGateDef, OpType, UnitID
+from pytket.circuit import (
+    Circuit,
+    Command,
+    CustomGateDef,
+    OpType,
+    UnitID,
+)
 
 from ..architecture import (
-    ConnectionType,
     EdgeType,
     MultiZoneArchitecture,
     source_edge_type,
@@ -35,6 +41,7 @@ from ..macro_architecture_graph import (
     ZoneId,
     empty_macro_arch_from_architecture,
 )
+from .helpers import copy_zone_placement, custom_gate_name
 
 ParamType: TypeAlias = Expr | float
 
@@ -51,6 +58,10 @@ class AcrossZoneOperationError(Exception):
     pass
 
 
+class CompiledCircuitValidationError(Exception):
+    pass
+
+
 class VirtualZonePosition(Enum):
     VirtualLeft = 0
     VirtualRight = 1
@@ -92,7 +103,32 @@ on must be located next to each other in the same zone.
 """
 
 
-@dataclass
+@cache
+def _move_barrier_gate(n_qubits: int) -> CustomGateDef:
+    """Custom `MOVE_BARRIER` Gate over n_qubits qubits
+
+    A `MOVE_BARRIER` is used during manual routing.
+
+    It prevents compiling through custom `MOVE` operations,
+    which could invalidate the manual routing. The definitions only
+    depend on the number of qubits, so they are shared between circuits.
+    """
+    move_barrier_def_circ = Circuit(n_qubits)
+    move_barrier_def_circ.add_barrier(list(range(n_qubits)))
+    return CustomGateDef("MOVE_BARRIER", move_barrier_def_circ, [])
+
+
+@cache
+def _init_gate(n_qubits: int) -> CustomGateDef:
+    """Custom `INIT` Gate over n_qubits qubits
+
+    A custom gate that represents the initialization of the qubits it acts on
+    within the zone whose id is provided as a gate parameter.
+    """
+    return CustomGateDef("INIT", Circuit(n_qubits), [dz])
+
+
+@dataclass(frozen=True, slots=True)
 class SwapWithinZone:
     """This class holds all information for defining a PSWAP"""
 
@@ -108,7 +144,7 @@ class SwapWithinZone:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Shuttle:
     """This class holds all information for defining a SHUTTLE operation"""
 
@@ -118,30 +154,18 @@ class Shuttle:
     source_edge: EdgeType
     target_edge: EdgeType
 
-    source_edge_int_encoding: int = field(init=False)
-    target_edge_int_encoding: int = field(init=False)
-
-    def __post_init__(self) -> None:
-        """
-        Encode left and right edges as negative or non-negative
-         number for use as tket custom op parameters
-        Yes, this is a hack
-        """
-        self.source_edge_int_encoding = -1 if self.source_edge == EdgeType.Left else 1
-        self.target_edge_int_encoding = -1 if self.target_edge == EdgeType.Left else 1
-
     def __str__(self) -> str:
         return f"{self.qubit}: {self.zone}"
 
     def append_to_circuit(self, circuit: "MultiZoneCircuit") -> None:
         circuit.pytket_circuit.add_custom_gate(
             shuttle_gate,
-            [self.zone, self.source_edge_int_encoding, self.target_edge_int_encoding],
+            [self.zone, int(self.source_edge), int(self.target_edge)],
             [self.qubit],
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Init:
     qubit: int
     zone: int
@@ -150,20 +174,154 @@ class Init:
 MZAOperation = SwapWithinZone | Shuttle
 
 
-def _swap_left_to_right_through_list(
-    qubit: int, qubit_list: list[int]
-) -> list[MZAOperation]:
-    """Generate a list of swap operations moving an ion from left to right
-    through a zone"""
-    return [SwapWithinZone(qubit, swap_qubit) for swap_qubit in qubit_list]
+@lru_cache(maxsize=4096)
+def _make_swap(qubit_0: int, qubit_1: int) -> SwapWithinZone:
+    """Shared SwapWithinZone instance, the same swaps recur across moves"""
+    return SwapWithinZone(qubit_0, qubit_1)
+
+
+@lru_cache(maxsize=4096)
+def _make_shuttle(
+    qubit: int, zone: int, source_edge: EdgeType, target_edge: EdgeType
+) -> Shuttle:
+    """Shared Shuttle instance, the same shuttles recur across moves"""
+    return Shuttle(qubit, zone, source_edge, target_edge)
 
 
-def _swap_right_to_left_through_list(
-    qubit: int, qubit_list: list[int]
-) -> list[MZAOperation]:
-    """Generate a list of swap operations moving an ion from right to left
-    through a zone"""
-    return [SwapWithinZone(swap_qubit, qubit) for swap_qubit in reversed(qubit_list)]
+class _ZoneOrder:
+    """Order of the ions within a zone with constant time position lookup
+
+    Positions are stored relative to a moving offset, so adding or removing
+    ions at either edge of the zone does not renumber the others.
+    """
+
+    __slots__ = ("_offset", "_positions", "_qubits")
+
+    def __init__(self, qubits: Iterable[int]):
+        self._qubits: deque[int] = deque(qubits)
+        self._offset = 0
+        self._positions = {qubit: i for i, qubit in enumerate(self._qubits)}
+
+    def adjacent(self, qubit_1: int, qubit_2: int) -> bool:
+        return abs(self._positions[qubit_1] - self._positions[qubit_2]) == 1
+
+    def is_left_end(self, qubit: int) -> bool:
+        return bool(self._qubits) and self._qubits[0] == qubit
+
+    def is_right_end(self, qubit: int) -> bool:
+        return bool(self._qubits) and self._qubits[-1] == qubit
+
+    def append(self, qubit: int) -> None:
+        self._positions[qubit] = self._offset + len(self._qubits)
+        self._qubits.append(qubit)
+
+    def appendleft(self, qubit: int) -> None:
+        self._offset -= 1
+        self._positions[qubit] = self._offset
+        self._qubits.appendleft(qubit)
+
+    def pop(self) -> int:
+        qubit = self._qubits.pop()
+        del self._positions[qubit]
+        return qubit
+
+    def popleft(self) -> int:
+        qubit = self._qubits.popleft()
+        del self._positions[qubit]
+        self._offset += 1
+        return qubit
+
+    def swap(self, qubit_1: int, qubit_2: int) -> None:
+        positions = self._positions
+        position_1, position_2 = positions[qubit_1], positions[qubit_2]
+        self._qubits[position_1 - self._offset] = qubit_2
+        self._qubits[position_2 - self._offset] = qubit_1
+        positions[qubit_1], positions[qubit_2] = position_2, position_1
+
+
+_IS_AT_EDGE: dict[EdgeType, Callable[[_ZoneOrder, int], bool]] = {
+    EdgeType.Left: _ZoneOrder.is_left_end,
+    EdgeType.Right: _ZoneOrder.is_right_end,
+}
+_REMOVE_FROM_EDGE: dict[EdgeType, Callable[[_ZoneOrder], int]] = {
+    EdgeType.Left: _ZoneOrder.popleft,
+    EdgeType.Right: _ZoneOrder.pop,
+}
+_ADD_AT_EDGE: dict[EdgeType, Callable[[_ZoneOrder, int], None]] = {
+    EdgeType.Left: _ZoneOrder.appendleft,
+    EdgeType.Right: _ZoneOrder.append,
+}
+
+
+# native operations that do not act on exactly two qubits
+_OTHER_NATIVE_OPTYPES = frozenset(
+    {OpType.Rx, OpType.Ry, OpType.Rz, OpType.Measure, OpType.Barrier}
+)
+
+
+def _arg_qubits(cmd: Command) -> tuple[int, ...]:
+    """Indices of the qubits a command acts on, excluding any bits"""
+    return tuple(qubit.index[0] for qubit in cmd.qubits)
+
+
+def _check_in_single_zone(i: int, cmd: Command, qubit_to_zone: list[int]) -> None:
+    """Raise an AcrossZoneOperationError if the qubits of the i-th command
+    are not all in the same zone"""
+    qubits = _arg_qubits(cmd)
+    if len(qubits) == 2:
+        # most multi-qubit operations act on two qubits, avoid building a set
+        qubit_1, qubit_2 = qubits
+        if qubit_to_zone[qubit_1] == qubit_to_zone[qubit_2]:
+            return
+    elif len({qubit_to_zone[q] for q in qubits}) == 1:
+        return
+    # only build the per-qubit zone listing for the error
+    qubit_to_zone_message = " ".join(
+        [f"q[{q}] in zone {qubit_to_zone[q]}," for q in qubits]
+    )
+    raise AcrossZoneOperationError(
+        f"Operation {i} = {cmd} involved qubits across multiple"
+        f"zones. {qubit_to_zone_message}"
+    )
+
+
+def _swaps_to_right_edge(
+    qubit: int, zone_qubit_list: list[int], position: int
+) -> Iterator[SwapWithinZone]:
+    """Generate the swap operations moving an ion from the given position
+    to the right edge of a zone"""
+    return (
+        _make_swap(qubit, swap_qubit)
+        for swap_qubit in itertools.islice(zone_qubit_list, position + 1, None)
+    )
+
+
+def _swaps_to_left_edge(
+    qubit: int, zone_qubit_list: list[int], position: int
+) -> Iterator[SwapWithinZone]:
+    """Generate the swap operations moving an ion from the given position
+    to the left edge of a zone"""
+    return (
+        _make_swap(swap_qubit, qubit)
+        for swap_qubit in itertools.islice(
+            reversed(zone_qubit_list), len(zone_qubit_list) - position, None
+        )
+    )
+
+
+_SWAPS_TO_EDGE: dict[
+    EdgeType, Callable[[int, list[int], int], Iterator[SwapWithinZone]]
+] = {
+    EdgeType.Right: _swaps_to_right_edge,
+    EdgeType.Left: _swaps_to_left_edge,
+}
+
+
+# virtual position of an ion that has just entered a zone through an edge
+_VIRTUAL_POSITION_AT_EDGE: dict[EdgeType, VirtualZonePosition] = {
+    EdgeType.Left: VirtualZonePosition.VirtualLeft,
+    EdgeType.Right: VirtualZonePosition.VirtualRight,
+}
 
 
 def _move_from_zone_position_to_connected_zone_edge(
@@ -173,35 +331,22 @@ def _move_from_zone_position_to_connected_zone_edge(
     move_source_edge_type: EdgeType,
     move_target_edge_type: EdgeType,
     target_zone: int,
-) -> list[MZAOperation]:
-    """Generate a list of swap and shuttle operations moving an ion from a
+) -> Iterator[MZAOperation]:
+    """Generate the swap and shuttle operations moving an ion from a
     given position within a zone to the edge of a target zone"""
-    move_operations = []
-    match (move_source_edge_type, position_in_zone):
-        case (EdgeType.Right, VirtualZonePosition.VirtualLeft):
-            move_operations.extend(
-                _swap_left_to_right_through_list(qubit, zone_qubit_list)
-            )
-        case (EdgeType.Left, VirtualZonePosition.VirtualRight):
-            move_operations.extend(
-                _swap_right_to_left_through_list(qubit, zone_qubit_list)
-            )
-        case (EdgeType.Right, VirtualZonePosition.VirtualRight):
-            pass
-        case (EdgeType.Left, VirtualZonePosition.VirtualLeft):
-            pass
-        case (EdgeType.Right, position) if isinstance(position, int):
-            move_operations.extend(
-                _swap_left_to_right_through_list(qubit, zone_qubit_list[position + 1 :])
-            )
-        case (EdgeType.Left, position) if isinstance(position, int):
-            move_operations.extend(
-                _swap_right_to_left_through_list(qubit, zone_qubit_list[:position])
-            )
-    move_operations.append(
-        Shuttle(qubit, target_zone, move_source_edge_type, move_target_edge_type)
+    # An ion at a virtual position sits just outside the zone, i.e. one
+    # position before the first or after the last ion of the zone
+    position: int
+    if position_in_zone is VirtualZonePosition.VirtualLeft:
+        position = -1
+    elif position_in_zone is VirtualZonePosition.VirtualRight:
+        position = len(zone_qubit_list)
+    else:
+        position = position_in_zone
+    yield from _SWAPS_TO_EDGE[move_source_edge_type](qubit, zone_qubit_list, position)
+    yield _make_shuttle(
+        qubit, target_zone, move_source_edge_type, move_target_edge_type
     )
-    return move_operations
 
 
 class MultiZoneCircuit:
@@ -217,61 +362,86 @@ class MultiZoneCircuit:
 
     architecture: MultiZoneArchitecture
     macro_arch: MultiZoneMacroArch
-    qubit_to_zones: dict[int, list[int]]
+    qubit_to_zones: list[list[int]]
     zone_to_qubits: dict[int, list[int]]
-    initial_zone_to_qubits: dict[int, list[int]]
-    multi_zone_operations: dict[int, list[list[MZAOperation]]]
+    initial_zone_to_qubits: dict[int, tuple[int, ...]]
     pytket_circuit: Circuit
     _is_compiled: bool = False
 
     def __init__(
         self,
         multi_zone_arch: MultiZoneArchitecture,
-        initial_zone_to_qubits: dict[int, list[int]],
+        initial_zone_to_qubits: Mapping[int, Sequence[int]],
         *args: int,
         **kwargs: str,
     ):
         self.architecture = multi_zone_arch
         self.macro_arch = empty_macro_arch_from_architecture(multi_zone_arch)
+        self._zone_max_ions = tuple(
+            multi_zone_arch.get_zone_max_ions(zone_id)
+            for zone_id in range(multi_zone_arch.n_zones)
+        )
+        # (source edge, target edge) of each connection between two zones
+        self._edge_types: dict[tuple[int, int], tuple[EdgeType, EdgeType]] = {}
+        for zone_id, arch_zone in enumerate(multi_zone_arch.zones):
+            for connected_zone in arch_zone.connected_zones:
+                connection_type = multi_zone_arch.get_connection_type(
+                    zone_id, connected_zone
+                )
+                self._edge_types[(zone_id, connected_zone)] = (
+                    source_edge_type(connection_type),
+                    target_edge_type(connection_type),
+                )
         self.pytket_circuit = Circuit(*args, **kwargs)
-        self.qubit_to_zones = {}
-        self.initial_zone_to_qubits = initial_zone_to_qubits
+        self._n_qubits_total = self.pytket_circuit.n_qubits
+        self.qubit_to_zones = [[] for _ in range(multi_zone_arch.n_qubits_max)]
+        self.initial_zone_to_qubits = {
+            zone: tuple(qubits) for zone, qubits in initial_zone_to_qubits.items()
+        }
         self.zone_to_qubits = {
             zone_id: [] for zone_id, _ in enumerate(multi_zone_arch.zones)
         }
-        self.multi_zone_operations = {
-            qubit: [] for qubit in range(multi_zone_arch.n_qubits_max)
-        }
-        for zone, qubits in initial_zone_to_qubits.items():
+        # All move operations, stored contiguously in the order they were added.
+        # The operations of each move_qubit call occupy a (start, end) span,
+        # the spans are listed per qubit.
+        self._ops_flat: list[MZAOperation] = []
+        self._ops_spans: list[list[tuple[int, int]]] = [
+            [] for _ in range(multi_zone_arch.n_qubits_max)
+        ]
+        for zone, qubits in self.initial_zone_to_qubits.items():
             self._place_qubits(zone, qubits)
 
-        self.all_qubit_list = list(range(len(self.pytket_circuit.qubits)))
-        move_barrier_def_circ = Circuit(len(self.all_qubit_list))
-        move_barrier_def_circ.add_barrier(self.all_qubit_list)
-        self.move_barrier_gate = CustomGateDef(
-            "MOVE_BARRIER", move_barrier_def_circ, []
+        self.all_qubit_list = tuple(range(self._n_qubits_total))
+        self.move_barrier_gate = _move_barrier_gate(self._n_qubits_total)
+        # zone of each qubit before any moves, copied as the starting point
+        # of each validation
+        self._initial_qubit_to_zone = _get_qubit_to_zone(
+            self._n_qubits_total, self.initial_zone_to_qubits
         )
-        """A `MOVE_BARRIER` is used during manual routing.
-
-        It prevents compiling through custom `MOVE` operations,
-        which could invalidate the manual routing
-        """
-        for zone, qubit_list in initial_zone_to_qubits.items():
-            init_def_circ = Circuit(len(qubit_list))
-            custom_init = CustomGateDef("INIT", init_def_circ, [dz])
-            """An `INIT` gate.
-
-            A custom gate that represents the initialization of the qubits it acts on
-            within the zone whose id is provided as a gate parameter.
-            """
-            self.pytket_circuit.add_custom_gate(custom_init, [zone], qubit_list)
+        # circuit qubits that are not in any zone, no operation may act on them
+        self._unplaced_qubits = frozenset(
+            qubit
+            for qubit, zone in enumerate(self._initial_qubit_to_zone)
+            if zone == -1
+        )
+        for zone, qubit_list in self.initial_zone_to_qubits.items():
+            self.pytket_circuit.add_custom_gate(
+                _init_gate(len(qubit_list)), [zone], qubit_list
+            )
 
         self._n_shuttles = 0
         self._n_pswaps = 0
+        # number of "MOVE" gates added to the underlying circuit
+        self._n_moves = 0
 
     def __iter__(self) -> Iterator:
         return self.pytket_circuit.__iter__()
 
+    @property
+    def zone_max_ions(self) -> tuple[int, ...]:
+        """Maximum number of ions in each zone of the architecture"""
+        return self._zone_max_ions
+
     @property
     def is_compiled(self) -> bool:
         return self._is_compiled
@@ -280,6 +450,42 @@ class MultiZoneCircuit:
     def is_compiled(self, new_value: bool) -> None:
         self._is_compiled = new_value
 
+    @property
+    def multi_zone_operations(self) -> dict[int, list[list[MZAOperation]]]:
+        """Move operations per qubit, one list for each move of that qubit
+
+        The dict is built from the stored operations on every access, so
+        in-place edits of it are not kept. Assign a new dict to replace
+        the operations. The keys of an assigned dict must be qubits supported
+        by the architecture, below its ``n_qubits_max``.
+        """
+        ops_flat = self._ops_flat
+        return {
+            qubit: [ops_flat[start:end] for start, end in spans]
+            for qubit, spans in enumerate(self._ops_spans)
+        }
+
+    @multi_zone_operations.setter
+    def multi_zone_operations(
+        self, new_value: dict[int, list[list[MZAOperation]]]
+    ) -> None:
+        n_qubits_max = self.architecture.n_qubits_max
+        ops_flat: list[MZAOperation] = []
+        ops_spans: list[list[tuple[int, int]]] = [[] for _ in range(n_qubits_max)]
+        for qubit, op_lists in new_value.items():
+            if not 0 <= qubit < n_qubits_max:
+                raise QubitPlacementError(
+                    f"Cannot record move operations for qubit {qubit},"
+                    f" architecture only supports up to {n_qubits_max} qubits"
+                )
+            spans = ops_spans[qubit]
+            for operations in op_lists:
+                start = len(ops_flat)
+                ops_flat.extend(operations)
+                spans.append((start, len(ops_flat)))
+        self._ops_flat = ops_flat
+        self._ops_spans = ops_spans
+
     def add_move_barrier(self) -> None:
         """Add custom gate MOVE_BARRIER
 
@@ -288,25 +494,36 @@ class MultiZoneCircuit:
         during compilation
         """
         self.pytket_circuit.add_custom_gate(
-            self.move_barrier_gate, [], self.all_qubit_list
+            self.move_barrier_gate, (), self.all_qubit_list
         )
 
-    def _place_qubit(self, zone: int, qubit: int) -> None:
-        if qubit in self.qubit_to_zones:
-            raise QubitPlacementError(f"Qubit {qubit} was already placed")
-        if (
-            self.architecture.get_zone_max_ions(zone)
-            < len(self.zone_to_qubits[zone]) + 1
-        ):
+    def _is_placed(self, qubit: int) -> bool:
+        return 0 <= qubit < len(self.qubit_to_zones) and bool(
+            self.qubit_to_zones[qubit]
+        )
+
+    def _place_qubits(self, zone: int, qubits: Sequence[int]) -> None:
+        zone_qubits = self.zone_to_qubits[zone]
+        if self._zone_max_ions[zone] < len(zone_qubits) + len(qubits):
             raise QubitPlacementError(
                 f"Cannot add ion to zone {zone}, maximum ion capacity already reached"
             )
-        self.qubit_to_zones[qubit] = [zone]
-        self.zone_to_qubits[zone].append(qubit)
-
-    def _place_qubits(self, zone: int, qubits: list[int]) -> None:
+        qubit_to_zones = self.qubit_to_zones
         for qubit in qubits:
-            self._place_qubit(zone, qubit)
+            if not 0 <= qubit < len(qubit_to_zones):
+                raise QubitPlacementError(
+                    f"Cannot place qubit {qubit}, architecture only supports"
+                    f" up to {len(qubit_to_zones)} qubits"
+                )
+            if qubit >= self._n_qubits_total:
+                raise QubitPlacementError(
+                    f"Cannot place qubit {qubit}, the circuit only has"
+                    f" {self._n_qubits_total} qubits"
+                )
+            if qubit_to_zones[qubit]:
+                raise QubitPlacementError(f"Qubit {qubit} was already placed")
+            qubit_to_zones[qubit] = [zone]
+        zone_qubits.extend(qubits)
 
     def move_qubit(self, qubit: int, new_zone: int, precompiled: bool = False) -> None:
         """Move a qubit from its current zone to new_zone
@@ -330,7 +547,7 @@ class MultiZoneCircuit:
         :param precompiled: whether the underlying pytket circuit has already been
          compiled (but not yet routed)
         """
-        if qubit not in self.qubit_to_zones:
+        if not self._is_placed(qubit):
             raise QubitPlacementError("Cannot move qubit that was never placed")
         old_zone = self.qubit_to_zones[qubit][-1]
         if old_zone == new_zone:
@@ -338,7 +555,7 @@ class MultiZoneCircuit:
                 f"Requested move has no effect,"
                 f" qubit {qubit} is already in zone {new_zone}"
             )
-        move_operations = []
+        move_operations: list[MZAOperation] = []
         shortest_path = self.macro_arch.shortest_path(
             ZoneId(old_zone), ZoneId(new_zone)
         )
@@ -349,14 +566,14 @@ class MultiZoneCircuit:
             )
 
         old_zone_qubits = self.zone_to_qubits[old_zone]
-        position_in_zone: int | VirtualZonePosition = old_zone_qubits.index(qubit)
+        old_position = old_zone_qubits.index(qubit)
+        position_in_zone: int | VirtualZonePosition = old_position
 
+        zone_to_qubits = self.zone_to_qubits
+        zone_max_ions = self._zone_max_ions
+        edge_types = self._edge_types
         for source_zone, target_zone in itertools.pairwise(shortest_path):
-            n_qubits_in_target_zone = len(self.zone_to_qubits[target_zone])
-            if (
-                self.architecture.get_zone_max_ions(target_zone)
-                < n_qubits_in_target_zone + 1
-            ):
+            if zone_max_ions[target_zone] < len(zone_to_qubits[target_zone]) + 1:
                 if target_zone == new_zone:
                     raise MoveError(
                         f"Cannot move ion to zone {target_zone},"
@@ -367,43 +584,64 @@ class MultiZoneCircuit:
                     f" but this zone is at maximum capacity"
                 )
 
-            connection_type = self.architecture.get_connection_type(
-                source_zone, target_zone
-            )
-            source_zone_qubits = self.zone_to_qubits[source_zone]
-            move_operations.extend(
-                _move_from_zone_position_to_connected_zone_edge(
-                    qubit,
-                    source_zone_qubits,
-                    position_in_zone,
-                    source_edge_type(connection_type),
-                    target_edge_type(connection_type),
-                    target_zone,
+            move_source_edge, move_target_edge = edge_types[(source_zone, target_zone)]
+            if position_in_zone is _VIRTUAL_POSITION_AT_EDGE[move_source_edge]:
+                # entered through the edge it leaves by, only a shuttle is needed
+                move_operations.append(
+                    _make_shuttle(
+                        qubit, target_zone, move_source_edge, move_target_edge
+                    )
                 )
-            )
-            if target_edge_type(connection_type) == EdgeType.Right:
-                position_in_zone = VirtualZonePosition.VirtualRight
             else:
-                position_in_zone = VirtualZonePosition.VirtualLeft
+                move_operations.extend(
+                    _move_from_zone_position_to_connected_zone_edge(
+                        qubit,
+                        zone_to_qubits[source_zone],
+                        position_in_zone,
+                        move_source_edge,
+                        move_target_edge,
+                        target_zone,
+                    )
+                )
+            position_in_zone = _VIRTUAL_POSITION_AT_EDGE[move_target_edge]
 
         if not precompiled:
             self.pytket_circuit.add_custom_gate(move_gate, [new_zone], [qubit])
             self.add_move_barrier()
-        old_zone_qubits.remove(qubit)
+            self._n_moves += 1
+        # the position is known, so avoid a second scan through remove()
+        del old_zone_qubits[old_position]
         if position_in_zone is VirtualZonePosition.VirtualLeft:
             self.zone_to_qubits[new_zone].insert(0, qubit)
         else:
             self.zone_to_qubits[new_zone].append(qubit)
         self.qubit_to_zones[qubit].append(new_zone)
-        self.multi_zone_operations[qubit].append(move_operations)
+        ops_start = len(self._ops_flat)
+        self._ops_flat.extend(move_operations)
+        self._ops_spans[qubit].append((ops_start, len(self._ops_flat)))
+        # one shuttle per hop along the path, all other operations are swaps
+        n_hops = len(shortest_path) - 1
+        self._n_shuttles += n_hops
+        self._n_pswaps += len(move_operations) - n_hops
         if precompiled:
-            for multi_op in move_operations:
-                if isinstance(multi_op, Shuttle):
-                    self._n_shuttles += 1
-                if isinstance(multi_op, SwapWithinZone):
-                    self._n_pswaps += 1
-                multi_op.append_to_circuit(self)
-            self.add_move_barrier()
+            self._add_move_operations(move_operations)
+
+    def _add_move_operations(self, move_operations: Iterable[MZAOperation]) -> None:
+        """Add the "PSWAP" and "SHUTTLE" gates of one move followed by a
+        "MOVE_BARRIER" to the underlying circuit"""
+        for multi_op in move_operations:
+            multi_op.append_to_circuit(self)
+        self.add_move_barrier()
+
+    def add_recorded_move(self, qubit: int, move_index: int) -> None:
+        """Add the "PSWAP" and "SHUTTLE" gates recorded for a move of a qubit,
+        followed by a "MOVE_BARRIER", to the underlying circuit
+
+        :param qubit: the moved qubit
+        :param move_index: index of the move among all moves of that qubit
+        """
+        start, end = self._ops_spans[qubit][move_index]
+        self._add_move_operations(self._ops_flat[start:end])
 
     def add_gate(
         self,
@@ -416,10 +654,7 @@ class MultiZoneCircuit:
                 "The manual addition of barriers is not currently"
                 " allowed within Multi Zone Circuits"
             )
-        if params is None:
-            self.pytket_circuit.add_gate(op_type, args)
-        else:
-            self.pytket_circuit.add_gate(op_type, params, args)
+        self.pytket_circuit.add_gate(op_type, () if params is None else params, args)
         return self
 
     def CX(self, control: int, target: int, **kwargs: Any) -> "MultiZoneCircuit":
@@ -431,13 +666,40 @@ class MultiZoneCircuit:
         return self
 
     def copy(self) -> "MultiZoneCircuit":
-        new_circuit = MultiZoneCircuit(self.architecture, self.initial_zone_to_qubits)
+        """Return an independent copy of this circuit"""
+        new_circuit = MultiZoneCircuit(
+            self.architecture,
+            self.initial_zone_to_qubits,
+            self._n_qubits_total,
+            self.pytket_circuit.n_bits,
+        )
+        # the macro architecture only depends on the architecture, share it
+        # together with its cached shortest paths
+        new_circuit.macro_arch = self.macro_arch
         new_circuit.pytket_circuit = self.pytket_circuit.copy()
-        new_circuit.qubit_to_zones = deepcopy(self.qubit_to_zones)
-        new_circuit.zone_to_qubits = deepcopy(self.zone_to_qubits)
-        new_circuit.multi_zone_operations = deepcopy(self.multi_zone_operations)
+        new_circuit.copy_move_state_from(self)
         return new_circuit
 
+    def copy_move_state_from(self, other: "MultiZoneCircuit") -> None:
+        """Take over the current placement, the recorded move operations and
+        the move, shuttle and pswap counts of another circuit
+
+        Used to carry a routing over to a circuit built on a new underlying
+        pytket circuit, e.g. after compilation. Both circuits must have the
+        same architecture and initial placement.
+
+        :param other: the circuit whose move state is copied
+        """
+        self.qubit_to_zones = [zones.copy() for zones in other.qubit_to_zones]
+        self.zone_to_qubits = copy_zone_placement(other.zone_to_qubits)
+        self._n_moves = other._n_moves
+        self._n_shuttles = other._n_shuttles
+        self._n_pswaps = other._n_pswaps
+        # SwapWithinZone and Shuttle are frozen, so the operations themselves
+        # can be shared between the circuits
+        self._ops_flat = other._ops_flat.copy()
+        self._ops_spans = [spans.copy() for spans in other._ops_spans]
+
     def get_n_shuttles(self) -> int:
         """
         Get the number of shuttles used to route the circuit to the architecture
@@ -451,121 +713,145 @@ class MultiZoneCircuit:
         return self._n_pswaps
 
     def validate(self) -> None:
+        if self._unplaced_qubits:
+            self._check_qubits_placed()
         if self._is_compiled:
             self._validate_compiled()
             return
 
-        current_multiop_index_per_qubit: dict[int, int] = {
-            k: 0 for k in self.multi_zone_operations
-        }
-        for i, cmd in enumerate(self.pytket_circuit):
-            op = cmd.op
-            if "MOVE_BARRIER" in f"{op}":
+        if self._n_moves == 0:
+            self._validate_without_moves(self._initial_qubit_to_zone)
+            return
+        # zone of each qubit at the current point in the circuit,
+        # updated whenever a MOVE is encountered
+        current_qubit_to_zone = self._initial_qubit_to_zone.copy()
+        for i, cmd in enumerate(self.pytket_circuit.get_commands()):
+            gate_name = custom_gate_name(cmd.op)
+            if gate_name == "MOVE_BARRIER":
                 pass
-            elif "MOVE" in f"{op}":
+            elif gate_name == "MOVE":
                 qubit = cmd.args[0].index[0]
-                current_multiop_index = current_multiop_index_per_qubit[qubit]
-                current_multiop_index_per_qubit[qubit] = current_multiop_index + 1
+                current_qubit_to_zone[qubit] = int(cmd.op.params[0])
             else:
-                qubits: list[int] = [q.index[0] for q in cmd.args]
-                cmd_qubit_zones = [
-                    self.qubit_to_zones[q][current_multiop_index_per_qubit[q]]
-                    for q in qubits
-                ]
-                if not all(zone == cmd_qubit_zones[0] for zone in cmd_qubit_zones):
-                    qubit_to_zone_message = " ".join(
-                        [
-                            f"q[{qz[0]}] in zone {qz[1]},"
-                            for qz in zip(qubits, cmd_qubit_zones)
-                        ]
-                    )
-                    raise AcrossZoneOperationError(
-                        f"Operation {i} = {cmd} involved qubits across multiple"
-                        f"zones. {qubit_to_zone_message}"
+                # single-qubit gates can't act across zones, only count
+                # their qubits instead of resolving the indices
+                if len(cmd.qubits) > 1:
+                    _check_in_single_zone(i, cmd, current_qubit_to_zone)
+
+    def _check_qubits_placed(self) -> None:
+        """Raise a QubitPlacementError if an operation acts on a qubit
+        that was not placed in any zone
+
+        Barriers, which span all qubits of the circuit, are allowed.
+        """
+        unplaced_qubits = self._unplaced_qubits
+        for i, cmd in enumerate(self.pytket_circuit.get_commands()):
+            if (
+                cmd.op.type == OpType.Barrier
+                or custom_gate_name(cmd.op) == "MOVE_BARRIER"
+            ):
+                continue
+            for qubit in _arg_qubits(cmd):
+                if qubit in unplaced_qubits:
+                    raise QubitPlacementError(
+                        f"Operation {i} = {cmd} acts on q[{qubit}],"
+                        f" which was not placed in any zone"
                     )
 
+    def _validate_without_moves(self, qubit_to_zone: list[int]) -> None:
+        """Validate a circuit to which no "MOVE" gates were added
+
+        The zone of each qubit never changes, so only multi-qubit commands
+        need to be inspected.
+        """
+        for i, cmd in enumerate(self.pytket_circuit.get_commands()):
+            if len(cmd.qubits) < 2 or custom_gate_name(cmd.op) == "MOVE_BARRIER":
+                continue
+            _check_in_single_zone(i, cmd, qubit_to_zone)
+
     def _validate_compiled(self) -> None:
-        current_placement = deepcopy(self.initial_zone_to_qubits)
-        current_qubit_to_zone = _get_qubit_to_zone(
-            self.pytket_circuit.n_qubits, current_placement
-        )
-        commands = self.pytket_circuit.get_commands()
-        for i, cmd in enumerate(commands):
+        initial_zone_to_qubits = self.initial_zone_to_qubits
+        get_edge_types = self._edge_types.get
+        current_qubit_to_zone = self._initial_qubit_to_zone.copy()
+        current_placement = {
+            zone: _ZoneOrder(initial_zone_to_qubits.get(zone, ()))
+            for zone in range(self.architecture.n_zones)
+        }
+        # stream the commands, the INIT gates are taken from the front
+        commands = iter(self.pytket_circuit)
+        # one INIT gate is added per initially occupied zone
+        n_init_gates = len(initial_zone_to_qubits)
+        # check init
+        for i, cmd in enumerate(itertools.islice(commands, n_init_gates)):
+            if custom_gate_name(cmd.op) != "INIT":
+                raise CompiledCircuitValidationError(
+                    f"Operation {i} = {cmd} is not an INIT, circuit must"
+                    f" start with {n_init_gates} INIT operations"
+                )
+            target_zone = int(cmd.op.params[0])
+            if initial_zone_to_qubits.get(target_zone) != _arg_qubits(cmd):
+                raise CompiledCircuitValidationError(
+                    f"Operation {i} = {cmd} does not match the initial"
+                    f" placement of zone {target_zone}"
+                )
+        for i, cmd in enumerate(commands, start=n_init_gates):
             op = cmd.op
-            optype = op.type
-            op_string = f"{op}"
-            # check init
-            if i < self.architecture.n_zones:
-                assert "INIT" in op_string
-                target_zone = int(op.params[0])
-                assert current_placement[target_zone] == [
-                    arg.index[0] for arg in cmd.args
-                ]
-            elif "MOVE_BARRIER" in op_string:
+            gate_name = custom_gate_name(op)
+            if gate_name == "MOVE_BARRIER":
                 pass
-            elif "PSWAP" in op_string:
+            elif gate_name == "PSWAP":
                 # check swap
-                qubit_1 = cmd.args[0].index[0]
-                qubit_2 = cmd.args[1].index[0]
+                qubit_1, qubit_2 = _arg_qubits(cmd)
                 zone = current_qubit_to_zone[qubit_1]
-                assert zone == current_qubit_to_zone[qubit_2]
-                index1 = current_placement[zone].index(qubit_1)
-                index2 = current_placement[zone].index(qubit_2)
-                assert abs(index1 - index2) == 1
+                if zone != current_qubit_to_zone[qubit_2] or not current_placement[
+                    zone
+                ].adjacent(qubit_1, qubit_2):
+                    raise CompiledCircuitValidationError(
+                        f"Operation {i} = {cmd} swaps ions that are not"
+                        f" neighbours in the same zone"
+                    )
                 # perform swap
-                current_placement[zone][index1] = qubit_2
-                current_placement[zone][index2] = qubit_1
-            elif "SHUTTLE" in op_string:
-                qubit = cmd.args[0].index[0]
+                current_placement[zone].swap(qubit_1, qubit_2)
+            elif gate_name == "SHUTTLE":
+                (qubit,) = _arg_qubits(cmd)
                 target_zone = int(op.params[0])
                 origin_zone = current_qubit_to_zone[qubit]
+                edge_types = get_edge_types((origin_zone, target_zone))
                 # check zones connected
-                assert (
-                    target_zone in self.architecture.zones[origin_zone].connected_zones
-                )
-                connection_type = self.architecture.get_connection_type(
-                    origin_zone, target_zone
-                )
-                # check connection exists and perform shuttle
-                match connection_type:
-                    case ConnectionType.LeftToLeft:
-                        assert current_placement[origin_zone].index(qubit) == 0
-                        current_placement[origin_zone].pop(0)
-                        current_placement[target_zone].insert(0, qubit)
-                    case ConnectionType.LeftToRight:
-                        assert current_placement[origin_zone].index(qubit) == 0
-                        current_placement[origin_zone].pop(0)
-                        current_placement[target_zone].append(qubit)
-                    case ConnectionType.RightToLeft:
-                        assert (
-                            current_placement[origin_zone].index(qubit)
-                            == len(current_placement[origin_zone]) - 1
-                        )
-                        current_placement[origin_zone].pop()
-                        current_placement[target_zone].insert(0, qubit)
-                    case ConnectionType.RightToRight:
-                        assert (
-                            current_placement[origin_zone].index(qubit)
-                            == len(current_placement[origin_zone]) - 1
-                        )
-                        current_placement[origin_zone].pop()
-                        current_placement[target_zone].append(qubit)
+                if edge_types is None:
+                    raise CompiledCircuitValidationError(
+                        f"Operation {i} = {cmd} shuttles between zones"
+                        f" {origin_zone} and {target_zone}, which are not connected"
+                    )
+                source_edge, target_edge = edge_types
+                # check qubit is at the connected edge and perform shuttle
+                origin_order = current_placement[origin_zone]
+                if not _IS_AT_EDGE[source_edge](origin_order, qubit):
+                    raise CompiledCircuitValidationError(
+                        f"Operation {i} = {cmd} shuttles q[{qubit}], which is not"
+                        f" at the {source_edge.name} edge of zone {origin_zone}"
+                    )
+                _REMOVE_FROM_EDGE[source_edge](origin_order)
+                _ADD_AT_EDGE[target_edge](current_placement[target_zone], qubit)
                 current_qubit_to_zone[qubit] = target_zone
-            elif len(cmd.args) == 2:
-                qubit_1 = cmd.args[0].index[0]
-                qubit_2 = cmd.args[1].index[0]
-                assert current_qubit_to_zone[qubit_1] == current_qubit_to_zone[qubit_2]
             else:
-                assert optype in [
-                    OpType.Rx,
-                    OpType.Ry,
-                    OpType.Rz,
-                    OpType.Measure,
-                    OpType.Barrier,
-                ]
+                qubits = _arg_qubits(cmd)
+                if len(qubits) == 2:
+                    qubit_1, qubit_2 = qubits
+                    if current_qubit_to_zone[qubit_1] != current_qubit_to_zone[qubit_2]:
+                        raise CompiledCircuitValidationError(
+                            f"Operation {i} = {cmd} involved qubits across"
+                            f" multiple zones"
+                        )
+                elif op.type not in _OTHER_NATIVE_OPTYPES:
+                    raise CompiledCircuitValidationError(
+                        f"Operation {i} = {cmd} is not a native operation"
+                    )
 
 
-def _get_qubit_to_zone(n_qubits: int, placement: dict[int, list[int]]) -> list[int]:
+def _get_qubit_to_zone(
+    n_qubits: int, placement: Mapping[int, Sequence[int]]
+) -> list[int]:
     qubit_to_zone: list[int] = [-1] * n_qubits
     for zone, qubits in placement.items():
         for qubit in qubits:
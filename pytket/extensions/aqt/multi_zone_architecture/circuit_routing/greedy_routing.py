@@ -11,12 +11,11 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from copy import deepcopy
 
 from pytket import Circuit, Qubit
 
 from ..architecture import MultiZoneArchitecture
-from ..circuit.helpers import ZonePlacement, ZoneRoutingError
+from ..circuit.helpers import ZonePlacement, ZoneRoutingError, copy_zone_placement
 from ..circuit.multizone_circuit import MultiZoneCircuit
 from .settings import RoutingSettings
 
@@ -54,7 +53,7 @@ class GreedyCircuitRouter:
         for zone, qubit_list in self._initial_placement.items():
             for qubit in qubit_list:
                 current_qubit_to_zone[qubit] = zone
-        current_zone_to_qubits = deepcopy(self._initial_placement)
+        current_zone_to_qubits = copy_zone_placement(self._initial_placement)
 
         for cmd in self._circuit.get_commands():
             n_args = len(cmd.args)
@@ -105,12 +104,9 @@ def _make_necessary_moves(
     zone1 = current_qubit_to_zone[qubit1]
     if zone0 == zone1:
         return
-    free_space_zone_0 = mz_circ.architecture.get_zone_max_ions(zone0) - len(
-        current_placement[zone0]
-    )
-    free_space_zone_1 = mz_circ.architecture.get_zone_max_ions(zone1) - len(
-        current_placement[zone1]
-    )
+    zone_max_ions = mz_circ.zone_max_ions
+    free_space_zone_0 = zone_max_ions[zone0] - len(current_placement[zone0])
+    free_space_zone_1 = zone_max_ions[zone1] - len(current_placement[zone1])
     match (free_space_zone_0, free_space_zone_1):
         case (0, 0):
             raise ValueError("Should not allow two full registers")
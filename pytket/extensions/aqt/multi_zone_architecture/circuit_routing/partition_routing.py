@@ -13,12 +13,11 @@
 # limitations under the License.
 import math
 from collections.abc import Generator
-from copy import deepcopy
 
 from pytket import Circuit
 
 from ..architecture import MultiZoneArchitecture
-from ..circuit.helpers import ZonePlacement, ZoneRoutingError
+from ..circuit.helpers import ZonePlacement, ZoneRoutingError, copy_zone_placement
 from ..circuit.multizone_circuit import MultiZoneCircuit
 from ..depth_list.depth_list import (
     DepthList,
@@ -135,7 +134,7 @@ class PartitionCircuitRouter:
 
         :param depth_list: The list of gates used to determine the next ion placement.
         """
-        current_placement = deepcopy(self._initial_placement)
+        current_placement = copy_zone_placement(self._initial_placement)
         n_qubits = self._circuit.n_qubits
         qubit_to_zone = _get_qubit_to_zone(n_qubits, current_placement)
         depth_list = get_updated_depth_list(n_qubits, qubit_to_zone, depth_list)
@@ -204,33 +203,29 @@ class PartitionCircuitRouter:
         num_spots = sum(
             [self._arch.get_zone_max_ions(i) for i, _ in enumerate(self._arch.zones)]
         )
-        edges: list[tuple[int, int]] = []
-        edge_weights: list[int] = []
-
-        # add gate edges
-        max_considered_depth = min(200, len(depth_list))
+        # add gate edges, accumulating the weight of each qubit pair
+        # (dicts keep insertion order, so edges stay in first-seen order)
+        gate_edge_weights: dict[tuple[int, int], int] = {}
+        max_considered_depth = 200
         max_weight = math.ceil(math.pow(2, 18))
-        for i, pairs in enumerate(depth_list):
-            if i > max_considered_depth:
-                break
+        for i, pairs in enumerate(depth_list[:max_considered_depth]):
             weight = math.ceil(math.exp(-2 * i) * max_weight)
             for pair in pairs:
-                if pair in edges:
-                    index = edges.index(pair)
-                    edge_weights[index] = edge_weights[index] + weight
-                else:
-                    edges.append(pair)
-                    edge_weights.append(weight)
+                gate_edge_weights[pair] = gate_edge_weights.get(pair, 0) + weight
+        edges: list[tuple[int, int]] = list(gate_edge_weights)
+        edge_weights: list[int] = list(gate_edge_weights.values())
 
         # add shuttling penalty (just distance between zones for now,
         # should later be dependent on shuttling cost)
         max_shuttle_weight = math.ceil(max_weight / 2)
+        # penalties are path lengths between zones, so at most num_zones - 1
+        penalty_weights = [
+            math.ceil(math.exp(-0.8 * penalty) * max_shuttle_weight)
+            for penalty in range(num_zones)
+        ]
         for zone, qubits in starting_placement.items():
             for other_zone in range(num_zones):
-                weight = math.ceil(
-                    math.exp(-0.8 * self.shuttling_penalty(zone, other_zone))
-                    * max_shuttle_weight
-                )
+                weight = penalty_weights[self.shuttling_penalty(zone, other_zone)]
                 if weight < 1:
                     continue
                 edges.extend([(other_zone + n_qubits, qubit) for qubit in qubits])
@@ -286,7 +281,7 @@ def _make_necessary_config_moves(
     qubit_to_zone_old = _get_qubit_to_zone(n_qubits, old_place)
     qubit_to_zone_new = _get_qubit_to_zone(n_qubits, new_place)
     qubits_to_move: list[tuple[int, int, int]] = []
-    current_placement = deepcopy(old_place)
+    current_placement = copy_zone_placement(old_place)
     for qubit in range(n_qubits):
         old_zone = qubit_to_zone_old[qubit]
         new_zone = qubit_to_zone_new[qubit]
@@ -295,9 +290,9 @@ def _make_necessary_config_moves(
                 (qubit, qubit_to_zone_old[qubit], qubit_to_zone_new[qubit])
             )
     # sort based on ascending number of free places in the target zone (at beginning)
+    zone_max_ions = mz_circ.zone_max_ions
     qubits_to_move.sort(
-        key=lambda x: mz_circ.architecture.get_zone_max_ions(x[2])
-        - len(current_placement[x[2]])
+        key=lambda x: zone_max_ions[x[2]] - len(current_placement[x[2]])
     )
 
     def _move_qubit(qubit_to_move: int, starting_zone: int, target_zone: int) -> None:
@@ -307,9 +302,7 @@ def _make_necessary_config_moves(
 
     while qubits_to_move:
         qubit, start, targ = qubits_to_move[-1]
-        free_space_target_zone = mz_circ.architecture.get_zone_max_ions(targ) - len(
-            current_placement[targ]
-        )
+        free_space_target_zone = zone_max_ions[targ] - len(current_placement[targ])
         match free_space_target_zone:
             case 0:
                 raise ValueError("Should not allow full register here")
@@ -17,7 +17,7 @@ from typing import NewType
 
 from networkx import (  # type: ignore
     Graph,
-    shortest_path,
+    all_pairs_shortest_path,
 )
 
 from .architecture import MultiZoneArchitecture
@@ -47,12 +47,19 @@ class MultiZoneMacroArch:
     )
 
     def shortest_path(self, zone_1: ZoneId, zone_2: ZoneId) -> list[ZoneId] | None:
-        path = self.shortest_paths.get((zone_1, zone_2))
-        if path:
-            return path
-        path = shortest_path(self.zones, zone_1, zone_2)
-        self.shortest_paths[(zone_1, zone_2)] = path
-        return path
+        """Shortest path between two zones, None if they are not connected
+
+        The paths between all pairs of zones are calculated in one batch
+        on the first call and reused afterwards.
+        """
+        if not self.shortest_paths:
+            self._calculate_all_shortest_paths()
+        return self.shortest_paths.get((zone_1, zone_2))
+
+    def _calculate_all_shortest_paths(self) -> None:
+        for source_zone, paths in all_pairs_shortest_path(self.zones):
+            for target_zone, path in paths.items():
+                self.shortest_paths[(source_zone, target_zone)] = path
 
 
 def empty_macro_arch_from_architecture(
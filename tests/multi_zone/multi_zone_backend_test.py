@@ -21,7 +21,9 @@ from pytket.extensions.aqt.backends.aqt_multi_zone import (
     get_aqt_json_syntax_for_compiled_circuit,
 )
 from pytket.extensions.aqt.multi_zone_architecture.circuit.multizone_circuit import (
+    CompiledCircuitValidationError,
     MultiZoneCircuit,
+    swap_gate,
 )
 from pytket.extensions.aqt.multi_zone_architecture.circuit_routing.settings import (
     RoutingAlg,
@@ -90,6 +92,32 @@ def test_valid_circuit_compiles(backend: AQTMultiZoneBackend) -> None:
     circuit = backend.compile_manually_routed_multi_zone_circuit(circuit)
 
 
+def test_compiled_circuit_with_unoccupied_zones_validates(
+    backend: AQTMultiZoneBackend,
+) -> None:
+    initial_placement = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}
+    circuit = MultiZoneCircuit(four_zones_in_a_line, initial_placement, 8)
+    circuit.CX(0, 1).CX(2, 3).CX(4, 5).CX(6, 7)
+    circuit.move_qubit(3, 1)
+    circuit.CX(3, 4)
+    circuit.measure_all()
+    compiled_circuit = backend.compile_manually_routed_multi_zone_circuit(circuit)
+    compiled_circuit.validate()
+
+
+def test_compiled_circuit_with_invalid_swap_does_not_validate(
+    backend: AQTMultiZoneBackend,
+) -> None:
+    initial_placement = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}
+    circuit = MultiZoneCircuit(four_zones_in_a_line, initial_placement, 8)
+    circuit.CX(0, 1).CX(4, 5)
+    circuit.measure_all()
+    compiled_circuit = backend.compile_manually_routed_multi_zone_circuit(circuit)
+    compiled_circuit.pytket_circuit.add_custom_gate(swap_gate, [], [0, 3])
+    with pytest.raises(CompiledCircuitValidationError):
+        compiled_circuit.validate()
+
+
 def test_circuit_compiles(backend: AQTMultiZoneBackend) -> None:
     circuit = Circuit(8)
     circuit.CX(0, 1).CX(2, 3).CX(4, 5).CX(6, 7)
@@ -151,6 +179,8 @@ def test_compiled_circuit_has_correct_syntax(backend: AQTMultiZoneBackend) -> No
 
     initialized_zones: list[int] = []
     number_initialized_qubits: int = 0
+    aqt_shuttles = 0
+    aqt_pswaps = 0
     for i, operation in enumerate(aqt_operation_list):
         if i < 2:
             assert operation[0] == "INIT"
@@ -178,14 +208,18 @@ def test_compiled_circuit_has_correct_syntax(backend: AQTMultiZoneBackend) -> No
             assert _zop_addresses_in_different_zones(operation[2][0], operation[2][1])
             assert _is_valid_zop(operation[2][0], initialized_zones)
             assert _is_valid_zop(operation[2][1], initialized_zones)
+            aqt_shuttles += 1
         elif operation[0] in ["PSWAP"]:
             assert len(operation) == 2
             assert len(operation[1]) == 2
             assert _zop_addresses_in_same_zone(operation[1][0], operation[1][1])
             assert _is_valid_zop(operation[1][0], initialized_zones)
             assert _is_valid_zop(operation[1][1], initialized_zones)
+            aqt_pswaps += 1
         else:
             raise Exception(f"Detected invalid operation type: {operation[0]}")
+    assert circuit.get_n_pswaps() == aqt_pswaps
+    assert circuit.get_n_shuttles() == aqt_shuttles
     assert initialized_zones == [zone for zone in initial_placement]
     assert number_initialized_qubits == 8
 
@@ -98,9 +98,47 @@ def test_move_on_missing_qubit_raises_placement_error(
         fix_circuit.move_qubit(9, 1)
 
 
+def test_placement_of_qubit_outside_circuit_raises_placement_error(
+    initial_placement: dict[int, list[int]],
+) -> None:
+    with pytest.raises(QubitPlacementError):
+        MultiZoneCircuit(four_zones_in_a_line, initial_placement, 6)
+
+
+@pytest.mark.parametrize("move_first", [False, True])
+def test_validation_of_operation_on_unplaced_qubit_throws(move_first: bool) -> None:
+    circuit = MultiZoneCircuit(four_zones_in_a_line, {0: [0, 1, 2], 1: [3, 4, 5]}, 8, 8)
+    if move_first:
+        circuit.move_qubit(0, 1)
+    circuit.CX(6, 7)
+    with pytest.raises(QubitPlacementError):
+        circuit.validate()
+
+    circuit = MultiZoneCircuit(four_zones_in_a_line, {0: [0, 1, 2], 1: [3, 4, 5]}, 8, 8)
+    if move_first:
+        circuit.move_qubit(0, 1)
+    circuit.add_gate(OpType.Rz, [7], [0.5])
+    with pytest.raises(QubitPlacementError):
+        circuit.validate()
+
+
+def test_setting_operations_of_unsupported_qubit_raises_placement_error(
+    fix_circuit: MultiZoneCircuit,
+) -> None:
+    operations = fix_circuit.multi_zone_operations
+    with pytest.raises(QubitPlacementError):
+        fix_circuit.multi_zone_operations = {four_zones_in_a_line.n_qubits_max: [[]]}
+    assert fix_circuit.multi_zone_operations == operations
+
+
 def test_add_barrier_throws_value_error(fix_circuit: MultiZoneCircuit) -> None:
     with pytest.raises(ValueError):
         fix_circuit.add_gate(OpType.Barrier, [0])
+    # pytket returns OpType values that are equal to, but not the same object
+    # as, the class attributes
+    barrier_type = Circuit(2).add_barrier([0, 1]).get_commands()[0].op.type
+    with pytest.raises(ValueError):
+        fix_circuit.add_gate(barrier_type, [0, 1])
 
 
 def test_validation_of_circuit_with_operation_across_zones_throws(
@@ -113,7 +151,57 @@ def test_validation_of_circuit_with_operation_across_zones_throws(
         circuit.validate()
 
 
+def test_validation_of_operation_with_moved_qubit_across_zones_throws(
+    initial_placement: dict[int, list[int]],
+) -> None:
+    circuit = MultiZoneCircuit(four_zones_in_a_line, initial_placement, 8)
+    circuit.CX(3, 0)
+    circuit.move_qubit(3, 2)
+    circuit.CX(3, 0)
+    circuit.measure_all()
+    with pytest.raises(AcrossZoneOperationError):
+        circuit.validate()
+
+
+def test_validation_of_measure_into_bit_of_other_zone_does_not_throw(
+    initial_placement: dict[int, list[int]],
+) -> None:
+    circuit = MultiZoneCircuit(four_zones_in_a_line, initial_placement, 8, 8)
+    # bit 5 shares its index with qubit 5, which is in another zone
+    circuit.pytket_circuit.Measure(0, 5)
+    circuit.validate()
+    circuit.move_qubit(7, 2)
+    circuit.pytket_circuit.Measure(1, 6)
+    circuit.validate()
+
+
 def test_validation_of_valid_circuit_does_not_throw(
     fix_circuit: MultiZoneCircuit,
 ) -> None:
     fix_circuit.validate()
+
+
+def test_copy_is_independent_of_original(fix_circuit: MultiZoneCircuit) -> None:
+    copied = fix_circuit.copy()
+    assert copied.pytket_circuit == fix_circuit.pytket_circuit
+    assert copied.zone_to_qubits == fix_circuit.zone_to_qubits
+    assert copied.multi_zone_operations == fix_circuit.multi_zone_operations
+    copied.move_qubit(5, 2)
+    assert copied.zone_to_qubits != fix_circuit.zone_to_qubits
+    assert copied.qubit_to_zones[5] != fix_circuit.qubit_to_zones[5]
+    assert copied.multi_zone_operations[5] != fix_circuit.multi_zone_operations[5]
+    copied.validate()
+    fix_circuit.validate()
+
+
+def test_copy_move_state_from_keeps_moves_for_validation(
+    initial_placement: dict[int, list[int]],
+) -> None:
+    old = MultiZoneCircuit(four_zones_in_a_line, initial_placement, 8)
+    old.move_qubit(2, 1)
+    old.CX(2, 4)
+    old.validate()
+    new = MultiZoneCircuit(four_zones_in_a_line, initial_placement, 8)
+    new.pytket_circuit = old.pytket_circuit.copy()
+    new.copy_move_state_from(old)
+    new.validate()